@@ -1,18 +1,22 @@
 import asyncio
-import json
+import concurrent.futures
 import os
 import logging
 import functools
-import traceback
-from datetime import datetime
-from typing import Annotated, Optional, Any, Callable, TypeVar, cast
+import hmac
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Annotated, Any, Callable, NamedTuple, TypeVar, cast
 
+import orjson
 from fastmcp import FastMCP
 from fastmcp.server.auth.providers.bearer import BearerAuthProvider, RSAKeyPair
 from mcp import ErrorData, McpError
 from mcp.server.auth.provider import AccessToken
 from mcp.types import TextContent, INVALID_PARAMS, INTERNAL_ERROR
-from pydantic import Field, BaseModel
+from pydantic import Field
 
 # --- Logging Configuration ---
 logging.basicConfig(
@@ -32,14 +36,16 @@ def log_errors(func: F) -> F:
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         try:
-            logger.info(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+            # Argument dumps are only formatted when someone is listening at DEBUG
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calling %s args=%s kwargs=%s", func.__name__, args, kwargs)
             result = await func(*args, **kwargs)
-            logger.info(f"{func.__name__} completed successfully")
+            logger.info("%s ok", func.__name__)
             return result
         except McpError as e:
-            error_msg = f"McpError in {func.__name__}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return f"❌ {error_msg}"
+            # Expected, user-facing failures; a traceback adds cost without adding information
+            logger.warning("McpError in %s: %s", func.__name__, e)
+            return f"❌ McpError in {func.__name__}: {str(e)}"
         except Exception as e:
             error_msg = f"Unexpected error in {func.__name__}: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -47,9 +53,12 @@ def log_errors(func: F) -> F:
     return cast(F, wrapper)
 
 # --- Load environment variables ---
-from dotenv import load_dotenv
+# Deployments set these directly; only pull in python-dotenv when a .env file is needed.
+# load_dotenv never overrides variables that are already set, so skipping it is equivalent.
+if not (os.environ.get("AUTH_TOKEN") and os.environ.get("MY_NUMBER")):
+    from dotenv import load_dotenv
 
-load_dotenv()
+    load_dotenv()
 
 TOKEN = os.environ.get("AUTH_TOKEN")
 MY_NUMBER = os.environ.get("MY_NUMBER")
@@ -58,40 +67,85 @@ assert TOKEN, "Please set AUTH_TOKEN in your .env file"
 assert MY_NUMBER, "Please set MY_NUMBER in your .env file"
 
 # --- Auth Provider ---
+# Only needed to satisfy BearerAuthProvider; tokens are checked in load_access_token.
+# Generating an RSA key is slow, so do it once per process rather than per provider.
+_KEY = RSAKeyPair.generate()
+
 class SimpleBearerAuthProvider(BearerAuthProvider):
     def __init__(self, token: str):
-        k = RSAKeyPair.generate()
-        super().__init__(public_key=k.public_key, jwks_uri=None, issuer=None, audience=None)
+        super().__init__(public_key=_KEY.public_key, jwks_uri=None, issuer=None, audience=None)
         self.token = token
+        self._token_bytes = token.encode()
+        # The token set is static, so every successful lookup can share one AccessToken
+        self._access_token = AccessToken(
+            token=token,
+            client_id="puch-client",
+            scopes=["*"],
+            expires_at=None,
+        )
 
     async def load_access_token(self, token: str) -> AccessToken | None:
-        if token == self.token:
-            return AccessToken(
-                token=token,
-                client_id="puch-client",
-                scopes=["*"],
-                expires_at=None,
-            )
+        candidate = token.encode()
+        # Bail early on a length mismatch; only the token's contents are secret
+        if len(candidate) == len(self._token_bytes) and hmac.compare_digest(candidate, self._token_bytes):
+            return self._access_token
         return None
 
 # --- Data Loading Utilities ---
-def load_data(filename: str):
-    """Load JSON data from the data directory with error handling."""
+# Data files live next to this script; resolve the directory once at import time
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+
+# How long a cached data file is trusted before its mtime is checked again
+_DATA_TTL = 30.0
+
+# Parsed data files, keyed by filename -> (last mtime check, mtime, data)
+_DATA_CACHE: dict[str, tuple[float, float, Any]] = {}
+# One lock per file so different files are parsed in parallel; the guard only
+# protects creation of the per-file locks
+_DATA_FILE_LOCKS: dict[str, threading.Lock] = {}
+_DATA_FILE_LOCKS_GUARD = threading.Lock()
+
+def _data_file_lock(filename: str) -> threading.Lock:
+    with _DATA_FILE_LOCKS_GUARD:
+        lock = _DATA_FILE_LOCKS.get(filename)
+        if lock is None:
+            lock = _DATA_FILE_LOCKS[filename] = threading.Lock()
+        return lock
+
+def _read_data_file(filename: str, filepath: str, mtime: float):
+    """Parse a data file into the cache; runs in a worker thread."""
+    with _data_file_lock(filename):
+        # Another request may have parsed the file while we waited on the lock
+        entry = _DATA_CACHE.get(filename)
+        if entry is not None and entry[1] == mtime:
+            return entry[2]
+        logger.debug("Loading data from %s", filepath)
+        with open(filepath, "rb") as f:
+            data = orjson.loads(f.read())
+        _DATA_CACHE[filename] = (time.monotonic(), mtime, data)
+    logger.debug("Successfully loaded data from %s", filepath)
+    return data
+
+async def load_data(filename: str):
+    """Load JSON data from the data directory, serving repeat reads from memory."""
     try:
-        # Get the directory where the current script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        # Build the path to the data file
-        filepath = os.path.join(script_dir, "data", filename)
-        logger.debug(f"Loading data from {filepath}")
-        with open(filepath, "r", encoding='utf-8') as f:
-            data = json.load(f)
-        logger.debug(f"Successfully loaded data from {filepath}")
-        return data
+        entry = _DATA_CACHE.get(filename)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < _DATA_TTL:
+            return entry[2]
+        filepath = str(_DATA_DIR / filename)
+        mtime = os.path.getmtime(filepath)
+        if entry is not None and entry[1] == mtime:
+            # Unchanged on disk; trust it for another TTL window
+            _DATA_CACHE[filename] = (now, mtime, entry[2])
+            return entry[2]
+        # Keep the event loop free for other requests while the file is parsed
+        return await asyncio.to_thread(_read_data_file, filename, filepath, mtime)
     except FileNotFoundError:
         error_msg = f"Data file not found: {filename}"
         logger.error(error_msg)
         raise McpError(ErrorData(code=INVALID_PARAMS, message=error_msg))
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         error_msg = f"Invalid JSON in {filename}: {str(e)}"
         logger.error(error_msg)
         raise McpError(ErrorData(code=INTERNAL_ERROR, message=error_msg))
@@ -100,6 +154,173 @@ def load_data(filename: str):
         logger.error(error_msg, exc_info=True)
         raise McpError(ErrorData(code=INTERNAL_ERROR, message=error_msg))
 
+# Lookup structures derived from a data file, keyed by filename and paired with
+# the parsed data they were built from so they are rebuilt whenever it reloads
+_INDEX_CACHE: dict[str, tuple[Any, Any]] = {}
+
+async def load_index(filename: str, build: Callable[[Any], Any]):
+    """Load a data file and return the index built from it by `build`."""
+    data = await load_data(filename)
+    cached = _INDEX_CACHE.get(filename)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    index = build(data)
+    _INDEX_CACHE[filename] = (data, index)
+    return index
+
+def _escape_braces(text: str) -> str:
+    """Escape data text for use inside a str.format() template."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+class Service(NamedTuple):
+    name: str
+    procedure: tuple[str, ...]
+    documents_required: tuple[str, ...]
+    official_link: str
+    fees: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Service":
+        """Convert one services.json entry, filling in defaults for optional fields."""
+        fees = data.get('fees')
+        return cls(
+            name=data['name'],
+            procedure=tuple(data.get('procedure') or ()),
+            documents_required=tuple(data.get('documents_required') or ()),
+            official_link=data.get('official_link') or '',
+            # Only the dict form of fees (new schema) is rendered
+            fees=tuple(fees.items()) if isinstance(fees, dict) else (),
+        )
+
+def render_service(service: Service) -> str:
+    """Format the step-by-step guide returned by /seva for one service."""
+    parts: list[str] = [f"📜 *Guide for {service.name}*\n\n"]
+    
+    if service.fees:
+        parts.append("💰 *Fees:*\n")
+        for fee_type, amount in service.fees:
+            parts.append(f"- *{fee_type}:* {amount}\n")
+        parts.append("\n")
+    
+    parts.append("📝 *Procedure:*\n")
+    for i, step in enumerate(service.procedure, 1):
+        parts.append(f"{i}. {step}\n")
+    
+    if service.documents_required:
+        parts.append("\n📄 *Documents Required:*\n")
+        for doc in service.documents_required:
+            parts.append(f"- {doc}\n")
+    
+    if service.official_link:
+        parts.append(f"\n🔗 *Official Link:* {service.official_link}")
+    
+    parts.append("\n\n🔄 *Need more help?* Ask me about any step!")
+    return "".join(parts)
+
+class ServiceCatalog(NamedTuple):
+    services: tuple[Service, ...]
+    by_name: dict[str, Service]
+    rendered: dict[str, str]
+    names: tuple[str, ...]
+    names_lc: frozenset[str]
+    available_services: str
+    not_found_template: str
+
+def build_service_catalog(data: list[dict]) -> ServiceCatalog:
+    """Index services by lowercased name and pre-render each guide."""
+    services = tuple(Service.from_dict(d) for d in data)
+    by_name: dict[str, Service] = {}
+    for s in services:
+        # Keep the first entry on duplicate names, as the old linear scan did
+        by_name.setdefault(s.name.lower(), s)
+    names = tuple(s.name for s in services)
+    available_services = ", ".join(names)
+    return ServiceCatalog(
+        services=services,
+        by_name=by_name,
+        rendered={name: render_service(s) for name, s in by_name.items()},
+        names=names,
+        names_lc=frozenset(by_name),
+        available_services=available_services,
+        not_found_template=(
+            "❌ Service not found: {name}.{suggestion} "
+            f"Available services are: {_escape_braces(available_services)}."
+        ),
+    )
+
+def suggest_services(catalog: ServiceCatalog, service_name: str) -> list[str]:
+    """Return display names of services that closely match a name with no exact match."""
+    import difflib  # only needed on the not-found path
+
+    matches = difflib.get_close_matches(service_name.lower(), catalog.names_lc, n=3)
+    return [catalog.by_name[m].name for m in matches]
+
+# Spelling out '&' with surrounding spaces lets split() collapse any resulting runs
+_CATEGORY_TRANS = str.maketrans({'&': ' and '})
+
+@functools.lru_cache(maxsize=512)
+def normalize_category(cat):
+    """Normalize a category name for flexible matching (special chars and whitespace)."""
+    if not cat:
+        return ''
+    return ' '.join(str(cat).lower().translate(_CATEGORY_TRANS).split())
+
+def render_scheme(scheme: dict) -> str:
+    """Format one scheme's entry in a /yojana category listing."""
+    parts = [f"🔹 *{scheme.get('name', 'Unnamed Scheme')}*"]
+    if 'description' in scheme:
+        parts.append(f"📝 *Description:* {scheme['description']}")
+    if 'eligibility_criteria' in scheme:
+        parts.append(f"✅ *Eligibility Criteria:* {scheme['eligibility_criteria']}")
+    if 'benefits' in scheme and isinstance(scheme['benefits'], list):
+        parts.append("💡 *Key Benefits:*" + "".join(f"\n  • {benefit}" for benefit in scheme['benefits']))
+    if 'official_link' in scheme:
+        parts.append(f"🔗 *Official Link:* {scheme['official_link']}")
+    return "\n\n".join(parts)
+
+class SchemeCatalog(NamedTuple):
+    schemes: list[dict]
+    by_category: dict[str, list[dict]]
+    rendered: dict[str, list[TextContent]]
+    categories: list[str]
+    categories_response: str
+    not_found_template: str
+
+def build_scheme_catalog(schemes: list[dict]) -> SchemeCatalog:
+    """Bucket schemes by normalized category and pre-render each category listing."""
+    by_category: dict[str, list[dict]] = defaultdict(list)
+    for s in schemes:
+        by_category[normalize_category(s.get('category'))].append(s)
+    # One chunk per scheme plus a footer; concatenated they read as a single listing,
+    # with a rule between schemes but not after the last one
+    separator = "\n\n" + "-"*30 + "\n\n"
+    footer = TextContent(type="text", text="*Need more details?* Ask me about any scheme!")
+    rendered = {}
+    for cat, bucket in by_category.items():
+        texts = [render_scheme(s) + separator for s in bucket[:-1]]
+        texts.append(render_scheme(bucket[-1]) + "\n\n")
+        rendered[cat] = [*(TextContent(type="text", text=t) for t in texts), footer]
+    categories = sorted(set(s.get('category', 'Uncategorized') for s in schemes))
+    category_lines = "".join(f"- {cat}\n" for cat in categories)
+    categories_response = (
+        "🌟 *Available Scheme Categories:*\n"
+        + category_lines
+        + "\nTo see schemes in a category, use `/yojana [category_name]`."
+    )
+    not_found_template = (
+        "❌ No schemes found in the '{category}' category.\n\n"
+        "Available categories are:\n"
+        + _escape_braces(category_lines)
+    )
+    return SchemeCatalog(
+        schemes=schemes,
+        by_category=dict(by_category),
+        rendered=rendered,
+        categories=categories,
+        categories_response=categories_response,
+        not_found_template=not_found_template,
+    )
+
 # --- MCP Server Setup ---
 mcp = FastMCP(
     "Digital Nagrik Mitra",
@@ -107,11 +328,10 @@ mcp = FastMCP(
 )
 
 # --- Tool: validate (required by Puch) ---
+# Called often as a liveness check and cannot fail, so it skips log_errors
 @mcp.tool
-@log_errors
 async def validate() -> str:
     """Validate the MCP server connection."""
-    logger.info("Validation request received")
     return MY_NUMBER
 
 # --- Tool: /seva ---
@@ -127,53 +347,27 @@ async def seva(service_name: Annotated[str, Field(description='The name of the g
     Returns:
         str: Formatted guide for the requested service
     """
-    logger.info(f"Processing request for service: {service_name}")
+    logger.debug("Processing request for service: %s", service_name)
     
     try:
-        # First try to load from services1.json, fallback to services.json if not found
-        try:
-            services = load_data("services.json")
-            logger.debug(f"Loaded {len(services)} services from services1.json")
-        except FileNotFoundError:
-            services = load_data("services.json")
-            logger.debug(f"Loaded {len(services)} services from services.json")
+        catalog = await load_index("services.json", build_service_catalog)
+        logger.debug("Loaded %d services from services.json", len(catalog.services))
         
-        service_info = next((s for s in services if s['name'].lower() == service_name.lower()), None)
+        response = catalog.rendered.get(service_name.lower())
 
-        if not service_info:
-            available_services = ", ".join([s['name'] for s in services])
-            error_msg = f"Service not found: {service_name}"
-            logger.warning(f"{error_msg}. Available services: {available_services}")
-            return f"❌ {error_msg}. Available services are: {available_services}."
+        if response is None:
+            logger.warning("Service not found: %s. Available services: %s", service_name, catalog.available_services)
+            # Fuzzy matching only runs on a miss, so exact hits pay nothing for it
+            suggestions = suggest_services(catalog, service_name)
+            suggestion = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+            return catalog.not_found_template.format(name=service_name, suggestion=suggestion)
 
-        logger.info(f"Found service: {service_info['name']}")
-        
-        response = f"📜 *Guide for {service_info['name']}*\n\n"
-        
-        # Add fees information if available (new schema)
-        if 'fees' in service_info and isinstance(service_info['fees'], dict):
-            response += "💰 *Fees:*\n"
-            for fee_type, amount in service_info['fees'].items():
-                response += f"- *{fee_type}:* {amount}\n"
-            response += "\n"
-        
-        response += "📝 *Procedure:*\n"
-        for i, step in enumerate(service_info.get('procedure', []), 1):
-            response += f"{i}. {step}\n"
-        
-        if 'documents_required' in service_info and service_info['documents_required']:
-            response += "\n📄 *Documents Required:*\n"
-            for doc in service_info['documents_required']:
-                response += f"- {doc}\n"
-        
-        if 'official_link' in service_info and service_info['official_link']:
-            response += f"\n🔗 *Official Link:* {service_info['official_link']}"
-        
-        response += "\n\n🔄 *Need more help?* Ask me about any step!"
-        
-        logger.debug(f"Successfully generated response for {service_name}")
+        logger.debug("Found service: %s", service_name)
         return response
         
+    except McpError:
+        # Data loading errors are already logged; log_errors turns them into the reply
+        raise
     except Exception as e:
         logger.error(f"Error in seva tool: {str(e)}", exc_info=True)
         return f"❌ An error occurred while processing your request: {str(e)}"
@@ -201,7 +395,7 @@ async def yojana(category: Annotated[str, Field(description="""
         - For health insurance: Use 'Health, Sanitation and Nutrition'
         
         If unsure about the category, you can first call without any category to see all available options.
-    """)] = '') -> str:
+    """)] = '') -> list[TextContent] | str:
     """
     Provides information about various Indian government schemes and yojanas.
     
@@ -231,70 +425,35 @@ async def yojana(category: Annotated[str, Field(description="""
         category: The category of schemes to list. If empty, lists all available categories.
         
     Returns:
-        str: Information about schemes in the specified category, or a list of all categories if none specified.
+        list[TextContent] | str: Information about schemes in the specified category, one chunk per scheme,
+        or a list of all categories if none specified.
     """
-    logger.info(f"Processing yojana request for category: {category or 'all'}")
+    logger.debug("Processing yojana request for category: %s", category or 'all')
     
     try:
-        schemes = load_data("schemes.json")
-        logger.debug(f"Loaded {len(schemes)} schemes from data")
+        catalog = await load_index("schemes.json", build_scheme_catalog)
+        logger.debug("Loaded %d schemes from data", len(catalog.schemes))
         
-        if not schemes:
+        if not catalog.schemes:
             logger.warning("No schemes found in the database")
             return "❌ No schemes available at the moment. Please check back later."
         
         if not category:
-            all_categories = sorted(list(set(s.get('category', 'Uncategorized') for s in schemes)))
-            response = "🌟 *Available Scheme Categories:*\n"
-            for cat in all_categories:
-                response += f"- {cat}\n"
-            response += "\nTo see schemes in a category, use `/yojana [category_name]`."
-            return response
+            return catalog.categories_response
 
         # List schemes in the specified category (flexible matching for special chars and whitespace)
-        def normalize_category(cat):
-            if not cat:
-                return ''
-            # Replace common variations and normalize whitespace
-            return ' '.join(str(cat).lower()
-                          .replace('&', 'and')
-                          .replace('  ', ' ')
-                          .strip()
-                          .split())
-        
-        normalized_target = normalize_category(category)
-        category_schemes = [s for s in schemes 
-                          if normalize_category(s.get('category')) == normalized_target]
-        if not category_schemes:
-            logger.warning(f"No schemes found in category: {category}")
-            response = "❌ No schemes found in the '{category}' category.\n\n"
-            response += "Available categories are:\n"
-            all_categories = sorted(list(set(s.get('category', 'Uncategorized') for s in schemes)))
-            for cat in all_categories:
-                response += f"- {cat}\n"
-            return response
-
-        response = f"📚 *Schemes in {category}:*\n\n"
-        for scheme in category_schemes:
-            response += f"🔹 *{scheme.get('name', 'Unnamed Scheme')}*\n\n"
-            if 'description' in scheme:
-                response += f"📝 *Description:* {scheme['description']}\n\n"
-            if 'eligibility_criteria' in scheme:
-                response += f"✅ *Eligibility Criteria:* {scheme['eligibility_criteria']}\n\n"
-            if 'benefits' in scheme and isinstance(scheme['benefits'], list):
-                response += "💡 *Key Benefits:*\n"
-                for benefit in scheme['benefits']:
-                    response += f"  • {benefit}\n"
-                response += "\n"
-                
-            if 'official_link' in scheme:
-                response += f"🔗 *Official Link:* {scheme['official_link']}\n"
-            response += "\n" + "-"*30 + "\n\n"
-            
-        response = response.rstrip("\n" + "-"*30 + "\n\n") + "\n\n*Need more details?* Ask me about any scheme!"
-        logger.info(f"Successfully generated response for category: {category}")
+        listing = catalog.rendered.get(normalize_category(category))
+        if listing is None:
+            logger.warning("No schemes found in category: %s", category)
+            return catalog.not_found_template.format(category=category)
+
+        response = [TextContent(type="text", text=f"📚 *Schemes in {category}:*\n\n"), *listing]
+        logger.debug("Successfully generated response for category: %s", category)
         return response
         
+    except McpError:
+        # Data loading errors are already logged; log_errors turns them into the reply
+        raise
     except Exception as e:
         logger.error(f"Error in yojana tool: {str(e)}", exc_info=True)
         return f"❌ An error occurred while processing your request: {str(e)}"
@@ -321,18 +480,90 @@ async def log_requests(request, call_next):
         
     except Exception as e:
         logger.error(f"Error processing request {request_id}: {str(e)}", exc_info=True)
+        from starlette.responses import JSONResponse
+
         return JSONResponse(
             status_code=500,
             content={"error": "Internal server error"}
         )
 
+# --- Shared Event Loop for Embedding Callers ---
+class AsyncLoopThread:
+    """Runs one asyncio event loop in a daemon thread so synchronous callers can share it."""
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="nagrik-mitra-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the shared loop and return a thread-safe future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+class MCPClientWrapper:
+    """Calls this server's tools in-process, fanning out over a shared AsyncLoopThread."""
+    def __init__(self, loop_thread: AsyncLoopThread):
+        self._loop_thread = loop_thread
+
+    async def _call(self, name: str, arguments: dict[str, Any]) -> str:
+        tool = await mcp.get_tool(name)
+        result = await tool.run(arguments)
+        return "".join(c.text for c in result.content if isinstance(c, TextContent))
+
+    def call_tool(self, name: str, **kwargs) -> concurrent.futures.Future:
+        """Start a tool call without blocking; the future resolves to the reply text."""
+        return self._loop_thread.submit(self._call(name, kwargs))
+
+    def run_tool_sync(self, name: str, timeout: float | None = None, **kwargs) -> str:
+        """Call a tool and block until its reply text is ready."""
+        return self.call_tool(name, **kwargs).result(timeout)
+
+# Created on first use so that simply importing this module never starts a thread
+_CLIENT: MCPClientWrapper | None = None
+_CLIENT_LOCK = threading.Lock()
+
+def get_client() -> MCPClientWrapper:
+    """Return the process-wide client bound to the shared event loop."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = MCPClientWrapper(AsyncLoopThread())
+        return _CLIENT
+
+def run_tool_sync(name: str, **kwargs) -> str:
+    """Call one of this server's tools from synchronous code, e.g. run_tool_sync("seva", service_name="Passport")."""
+    return get_client().run_tool_sync(name, **kwargs)
+
 # --- Run MCP Server ---
 async def main():
     logger.info("🚀 Starting Digital Nagrik Mitra MCP Server...")
     logger.info(f"Server will run on http://0.0.0.0:8086")
     
     try:
-        await mcp.run_async("streamable-http", host="0.0.0.0", port=8086)
+        # Parse both data files concurrently so the first requests hit a warm cache
+        await asyncio.gather(
+            load_index("services.json", build_service_catalog),
+            load_index("schemes.json", build_scheme_catalog),
+        )
+        # Every tool is a pure function of its arguments, so skip per-client session state.
+        # JSON-RPC batches are not accepted by the current MCP transport; clients that want
+        # several tool calls per turn should issue them as concurrent POSTs to /mcp/.
+        await mcp.run_async(
+            "streamable-http",
+            host="0.0.0.0",
+            port=8086,
+            stateless_http=True,
+            # C HTTP parser instead of uvicorn's pure-Python h11
+            uvicorn_config={"http": "httptools"},
+        )
     except Exception as e:
         logger.critical(f"Failed to start server: {str(e)}", exc_info=True)
         raise
@@ -343,6 +574,13 @@ if __name__ == "__main__":
     try:
         print("Starting Digital Nagrik Mitra MCP Server...")
         print("Logs are being written to 'nagrik_mitra.log'")
+        # uvicorn serves on the loop asyncio.run creates, so swap in uvloop before it exists
+        try:
+            import uvloop
+        except ImportError:  # uvloop does not support Windows
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")